@@ -1,7 +1,9 @@
 # app/__init__.py
 from flask import Flask, request, jsonify, redirect
 from config import Config
-from app.extensions import db, login_manager, limiter
+from app.extensions import (
+    db, login_manager, limiter, breaker, governor, dict_snapshot, ai_router, profiler,
+)
 from uuid import UUID
 
 def create_app(config_class=Config):
@@ -11,15 +13,26 @@ def create_app(config_class=Config):
     db.init_app(app)
     login_manager.init_app(app)
     limiter.init_app(app)
+    breaker.init_app(app)
+    governor.init_app(app)
+    dict_snapshot.init_app(app)
+    ai_router.init_app(app)
+    profiler.init_app(app)
 
     # 블루프린트 등록
     #   auth      : Admin 세션 로그인/로그아웃 (JSON)
-    #   ai        : OpenAI 단어 생성 (/api/ai/*)
+    #   ai        : AI 단어 생성 (/api/ai/*, OpenAI/Anthropic/Gemini 라우팅)
+    #   overview  : Overview 대시보드 스냅샷 (/api/overview, 백그라운드 갱신)
+    #   dictionary: 사전 mmap 스냅샷 단어 상세 (/api/dictionary/*)
+    #   profiling : 요청 프로파일 트레이스 목록/다운로드 (/api/_profile)
     #   api_proxy : heyvoca_back /admin/* 제너릭 프록시 (/api/*)
     #   spa       : React SPA catch-all (마지막)
-    from app.routes import auth, ai, api_proxy, spa
+    from app.routes import auth, ai, overview, dictionary, profiling, api_proxy, spa
     app.register_blueprint(auth.bp, url_prefix='/auth')
     app.register_blueprint(ai.bp)
+    app.register_blueprint(overview.bp)
+    app.register_blueprint(dictionary.bp)
+    app.register_blueprint(profiling.bp)
     app.register_blueprint(api_proxy.bp)
     app.register_blueprint(spa.bp)
 
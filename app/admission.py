@@ -0,0 +1,205 @@
+"""
+무거운 작업(AI 단어 생성, 예문 태깅, 엑셀 업로드, 사전 동기화) 동시 실행 제어.
+
+- 전역 동시 실행 ADMISSION_GLOBAL_LIMIT, 어드민별 ADMISSION_PER_ADMIN_LIMIT 까지 즉시 통과.
+- 넘치면 어드민별 FIFO 큐에 넣고, 슬롯이 비면 어드민 간 라운드로빈으로 배정한다
+  (한 어드민이 여러 건을 몰아 넣어도 다른 어드민 요청이 뒤로 밀리지 않는다).
+- 대기열이 ADMISSION_QUEUE_SIZE(어드민당 ADMISSION_PER_ADMIN_QUEUE)로 가득 찼거나
+  ADMISSION_QUEUE_TIMEOUT 초 안에 배정되지 않으면 Overloaded → 429 + Retry-After
+  (init_app 이 등록하는 errorhandler).
+
+실행 슬롯은 ADMISSION_LOCK_DIR 의 슬롯 파일 flock 으로 잡는다 → 같은 호스트의 모든 gunicorn
+워커가 한도를 공유한다(프로세스가 죽으면 OS 가 락을 풀어 준다). 대기열/라운드로빈은 워커 안에서
+돌고, 다른 워커가 푼 슬롯은 ADMISSION_POLL_SECONDS 간격으로 다시 시도해 가져간다.
+gunicorn 은 gthread(--threads)로 띄워 무거운 작업이 스레드 하나만 점유하게 하고,
+목록/수정 같은 가벼운 요청은 나머지 스레드가 바로 처리한다.
+"""
+import fcntl
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+
+class Overloaded(Exception):
+    """대기열 초과/대기 시간 초과. retry_after: 재시도 권장(초)."""
+
+    def __init__(self, retry_after):
+        super().__init__(f'too many expensive requests (retry after {retry_after}s)')
+        self.retry_after = retry_after
+
+
+class _Ticket:
+    __slots__ = ('key', 'slots')
+
+    def __init__(self, key):
+        self.key = key
+        self.slots = None   # 배정되면 (전역 fd, 어드민 fd)
+
+
+def _try_lock(path):
+    fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _unlock(fd):
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+class AdmissionGovernor:
+    def __init__(self, global_limit=2, per_key_limit=1, queue_size=4, per_key_queue=2, queue_timeout=30.0):
+        self.global_limit = global_limit
+        self.per_key_limit = per_key_limit
+        self.queue_size = queue_size
+        self.per_key_queue = per_key_queue
+        self.queue_timeout = queue_timeout
+        self.lock_dir = None
+        self.poll = 0.2
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._inflight_by_key = {}
+        self._queues = OrderedDict()   # key → deque[_Ticket], 순서 = 라운드로빈 순번
+        self._queued = 0
+        self._avg_hold = 10.0          # 작업 소요시간 EWMA(초) — Retry-After 추정용
+        self._total_rejected = 0
+
+    def init_app(self, app):
+        cfg = app.config
+        self.global_limit = cfg.get('ADMISSION_GLOBAL_LIMIT', self.global_limit)
+        self.per_key_limit = cfg.get('ADMISSION_PER_ADMIN_LIMIT', self.per_key_limit)
+        self.queue_size = cfg.get('ADMISSION_QUEUE_SIZE', self.queue_size)
+        self.per_key_queue = cfg.get('ADMISSION_PER_ADMIN_QUEUE', self.per_key_queue)
+        self.queue_timeout = cfg.get('ADMISSION_QUEUE_TIMEOUT', self.queue_timeout)
+        self.lock_dir = cfg['ADMISSION_LOCK_DIR']
+        self.poll = cfg.get('ADMISSION_POLL_SECONDS', self.poll)
+        os.makedirs(self.lock_dir, exist_ok=True)
+        app.register_error_handler(Overloaded, _overloaded_response)
+
+    # ── 내부 (self._cond 잡은 상태에서 호출) ──
+    def _lock_any(self, prefix, count):
+        for i in range(count):
+            fd = _try_lock(os.path.join(self.lock_dir, f'{prefix}-{i}.lock'))
+            if fd is not None:
+                return fd
+        return None
+
+    def _acquire(self, key):
+        """호스트 공유 슬롯(전역 1 + 어드민 1) 획득. 하나라도 없으면 None."""
+        g = self._lock_any('global', self.global_limit)
+        if g is None:
+            return None
+        digest = hashlib.sha1(str(key).encode()).hexdigest()[:16]
+        a = self._lock_any(f'admin-{digest}', self.per_key_limit)
+        if a is None:
+            _unlock(g)
+            return None
+        return g, a
+
+    def _start(self, key):
+        self._inflight += 1
+        self._inflight_by_key[key] = self._inflight_by_key.get(key, 0) + 1
+
+    def _dispatch(self):
+        """빈 슬롯을 대기 중인 어드민들에게 라운드로빈으로 배정."""
+        granted = False
+        for key in list(self._queues):
+            slots = self._acquire(key)
+            if slots is None:
+                continue
+            q = self._queues.pop(key)
+            ticket = q.popleft()
+            self._queued -= 1
+            ticket.slots = slots
+            self._start(key)
+            granted = True
+            if q:
+                self._queues[key] = q   # 남은 요청은 맨 뒤 순번으로
+        if granted:
+            self._cond.notify_all()
+
+    def _retry_after(self):
+        waves = (self._queued + 1) / max(1, self.global_limit)
+        return max(1, math.ceil(self._avg_hold * waves))
+
+    def _reject(self):
+        self._total_rejected += 1
+        return Overloaded(self._retry_after())
+
+    # ── 공개 API ──
+    @contextmanager
+    def slot(self, key):
+        with self._cond:
+            # 대기 중인 요청은 매 _dispatch 후 모두 실행 불가 상태 → 자기 대기열이 없고
+            # 슬롯이 있으면 바로 실행해도 다른 어드민을 추월하지 않는다.
+            slots = self._acquire(key) if key not in self._queues else None
+            if slots is not None:
+                self._start(key)
+            else:
+                own = len(self._queues.get(key, ()))
+                if self._queued >= self.queue_size or own >= self.per_key_queue:
+                    raise self._reject()
+                ticket = _Ticket(key)
+                self._queues.setdefault(key, deque()).append(ticket)
+                self._queued += 1
+                self._dispatch()
+                deadline = time.monotonic() + self.queue_timeout
+                while ticket.slots is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        q = self._queues.get(key)
+                        q.remove(ticket)
+                        if not q:
+                            del self._queues[key]
+                        self._queued -= 1
+                        raise self._reject()
+                    self._cond.wait(min(remaining, self.poll))
+                    if ticket.slots is None:
+                        self._dispatch()   # 다른 워커가 푼 슬롯은 알림이 없으므로 주기적으로 재시도
+                slots = ticket.slots
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._cond:
+                for fd in slots:
+                    _unlock(fd)
+                self._inflight -= 1
+                left = self._inflight_by_key[key] - 1
+                if left:
+                    self._inflight_by_key[key] = left
+                else:
+                    del self._inflight_by_key[key]
+                self._avg_hold = 0.8 * self._avg_hold + 0.2 * (time.monotonic() - started)
+                self._dispatch()
+
+    def snapshot(self):
+        with self._cond:
+            # inflight/queued 는 이 워커 기준, 한도는 호스트 전체 기준
+            return {
+                'inflight': self._inflight,
+                'queued': self._queued,
+                'global_limit': self.global_limit,
+                'per_admin_limit': self.per_key_limit,
+                'queue_size': self.queue_size,
+                'per_admin_queue': self.per_key_queue,
+                'avg_seconds': round(self._avg_hold, 2),
+                'total_rejected': self._total_rejected,
+            }
+
+
+def _overloaded_response(e):
+    from flask import jsonify
+    return jsonify({
+        'code': 429,
+        'message': '무거운 작업이 많이 실행 중입니다. 잠시 후 다시 시도하세요.',
+    }), 429, {'Retry-After': str(e.retry_after)}
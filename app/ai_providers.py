@@ -0,0 +1,285 @@
+"""
+AI 단어 생성 공급자 추상화 — OpenAI / Anthropic / Gemini 중 가장 빠르고 건강한 곳으로 라우팅.
+
+공통 계약: Provider.complete(prompt) -> 응답 텍스트. JSON 배열 추출/파싱은 AiRouter 가 한다
+(파싱 실패도 그 공급자의 실패로 보고 다음 공급자로 넘어간다).
+
+- 키가 설정된 공급자만 활성화(OPENAI/ANTHROPIC/GEMINI_API_KEY). *_BASE_URL 로 주소를 바꿀 수
+  있어 로컬 가짜 서버로 테스트 가능.
+- 공급자별 지연(요청 단어 1개당 초, EWMA)과 오류율(EWMA)을 기록해 시도 순서를 정한다:
+  건강한 공급자 점수순 → 직전 호출이 실패한 공급자(성공 없이 실패만 있으면 맨 끝) → 쿨다운 중.
+  연속 AI_PROVIDER_FAIL_LIMIT 회 실패하면 AI_PROVIDER_COOLDOWN 초 동안 쿨다운.
+- 탐색: 아직 호출 안 해 본 공급자, 쿨다운이 끝난 공급자, 마지막 측정이 AI_PROVIDER_REPROBE_SECONDS
+  보다 오래된 공급자는 점수 0 으로 맨 앞 — 한 번 호출해 다시 측정한다(오래된 표본에 묶이지 않게).
+- 출력 토큰 한도는 공급자 공통 MAX_OUTPUT_TOKENS(150단어 + 뜻/예문 JSON 이 잘리지 않게).
+  Gemini 2.5 는 thinking 토큰도 출력 한도를 쓰므로 thinking 을 끈다.
+- AI_HEDGE_DELAY_SECONDS > 0 이면 첫 공급자가 그 시간 안에 답하지 않을 때 다음 공급자에도
+  같은 요청을 보내 먼저 성공한 결과를 쓴다. 진 쪽 요청은 끝까지 실행되므로(토큰 비용) 기본은 끔.
+
+통계는 워커 프로세스 단위. Anthropic/Gemini 는 SDK 없이 REST(requests)로 호출한다.
+"""
+import json
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+from openai import OpenAI
+
+_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ai-provider')
+
+
+class NoProviderAvailable(Exception):
+    """활성화된(키가 설정된) 공급자가 없음."""
+
+
+# 모든 공급자 공통 출력 한도 (기존 OpenAI 경로와 동일)
+MAX_OUTPUT_TOKENS = 16384
+
+
+class Provider(ABC):
+    name = None
+
+    def __init__(self, api_key, model, base_url, timeout, max_tokens=MAX_OUTPUT_TOKENS):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_tokens = max_tokens
+
+    @abstractmethod
+    def complete(self, prompt):
+        """프롬프트 → 응답 텍스트. 실패는 예외로."""
+
+
+class OpenAIProvider(Provider):
+    name = 'openai'
+
+    def complete(self, prompt):
+        client = OpenAI(api_key=self.api_key, base_url=self.base_url or None, timeout=self.timeout)
+        response = client.chat.completions.create(
+            model=self.model,
+            messages=[{'role': 'user', 'content': prompt}],
+            temperature=0.7,
+            max_tokens=self.max_tokens,
+        )
+        print(f'[AI] openai model={response.model}, tokens={response.usage.total_tokens}')
+        return response.choices[0].message.content
+
+
+class AnthropicProvider(Provider):
+    name = 'anthropic'
+
+    def complete(self, prompt):
+        resp = requests.post(
+            f"{(self.base_url or 'https://api.anthropic.com').rstrip('/')}/v1/messages",
+            headers={'x-api-key': self.api_key, 'anthropic-version': '2023-06-01'},
+            json={
+                'model': self.model,
+                'max_tokens': self.max_tokens,
+                'temperature': 0.7,
+                'messages': [{'role': 'user', 'content': prompt}],
+            },
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        body = resp.json()
+        usage = body.get('usage', {})
+        print(f"[AI] anthropic model={body.get('model')}, "
+              f"tokens={usage.get('input_tokens', 0) + usage.get('output_tokens', 0)}")
+        return ''.join(c.get('text', '') for c in body.get('content', []))
+
+
+class GeminiProvider(Provider):
+    name = 'gemini'
+
+    def complete(self, prompt):
+        base = (self.base_url or 'https://generativelanguage.googleapis.com').rstrip('/')
+        resp = requests.post(
+            f'{base}/v1beta/models/{self.model}:generateContent',
+            headers={'x-goog-api-key': self.api_key},
+            json={
+                'contents': [{'parts': [{'text': prompt}]}],
+                'generationConfig': {
+                    'temperature': 0.7,
+                    'maxOutputTokens': self.max_tokens,
+                    'thinkingConfig': {'thinkingBudget': 0},   # thinking 이 출력 한도를 먹지 않게
+                },
+            },
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        body = resp.json()
+        print(f"[AI] gemini model={self.model}, tokens={body.get('usageMetadata', {}).get('totalTokenCount')}")
+        parts = body['candidates'][0]['content']['parts']
+        return ''.join(p.get('text', '') for p in parts)
+
+
+# config 접두어 → 공급자 클래스 / 기본 모델
+_PROVIDERS = {
+    'OPENAI': (OpenAIProvider, 'gpt-4o-mini'),
+    'ANTHROPIC': (AnthropicProvider, 'claude-haiku-4-5'),
+    'GEMINI': (GeminiProvider, 'gemini-2.5-flash'),
+}
+
+
+def parse_words(text):
+    """모델 응답에서 JSON 배열만 뽑아 파싱. 실패 시 json.JSONDecodeError."""
+    text = text.strip()
+    match = re.search(r'\[.*\]', text, re.DOTALL)
+    if match:
+        text = match.group(0)
+    return json.loads(text.strip())
+
+
+class _Stats:
+    def __init__(self):
+        self.latency = None       # 요청 단어 1개당 초 (EWMA)
+        self.measured_at = 0.0    # 마지막 성공(monotonic)
+        self.error_rate = 0.0     # EWMA
+        self.consecutive_errors = 0
+        self.cooldown_until = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.last_error = None
+
+
+class AiRouter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._providers = []
+        self._stats = {}
+        self.hedge_delay = 0.0
+        self.fail_limit = 3
+        self.cooldown = 60.0
+        self.reprobe = 300.0
+
+    def init_app(self, app):
+        cfg = app.config
+        self._providers = []
+        for prefix, (cls, default_model) in _PROVIDERS.items():
+            api_key = cfg.get(f'{prefix}_API_KEY')
+            if not api_key:
+                continue
+            self._providers.append(cls(
+                api_key=api_key,
+                model=cfg.get(f'{prefix}_MODEL') or default_model,
+                base_url=cfg.get(f'{prefix}_BASE_URL') or None,
+                timeout=cfg.get('AI_TIMEOUT', 120),
+            ))
+        self._stats = {p.name: _Stats() for p in self._providers}
+        self.hedge_delay = cfg.get('AI_HEDGE_DELAY_SECONDS', self.hedge_delay)
+        self.fail_limit = cfg.get('AI_PROVIDER_FAIL_LIMIT', self.fail_limit)
+        self.cooldown = cfg.get('AI_PROVIDER_COOLDOWN', self.cooldown)
+        self.reprobe = cfg.get('AI_PROVIDER_REPROBE_SECONDS', self.reprobe)
+
+    @property
+    def enabled(self):
+        return bool(self._providers)
+
+    def _ranked(self):
+        """시도 순서. (등급, 점수) 오름차순 — 등급: 0 건강·탐색 / 1 직전 실패 / 2 쿨다운."""
+        now = time.monotonic()
+
+        def score(p):
+            s = self._stats[p.name]
+            if s.cooldown_until > now:
+                return (2, 0.0)
+            if self._needs_probe(s, now):
+                return (0, 0.0)
+            tier = 1 if s.consecutive_errors else 0
+            if s.latency is None:
+                # 성공 기록 없이 실패만 있으면 측정된 어떤 공급자보다 뒤
+                return (tier, math.inf)
+            return (tier, s.latency * (1 + 4 * s.error_rate))
+
+        with self._lock:
+            return sorted(self._providers, key=score)
+
+    def _needs_probe(self, s, now):
+        """한 번 호출해 다시 측정할 공급자 — 미시도 / 쿨다운 종료 직후 / 측정이 오래됨."""
+        if s.calls == 0:
+            return True
+        if s.consecutive_errors >= self.fail_limit:
+            return True   # 쿨다운이 끝남(실패하면 곧바로 다시 쿨다운)
+        return s.latency is not None and not s.consecutive_errors and now - s.measured_at > self.reprobe
+
+    def _record(self, provider, elapsed, weight, error=None):
+        with self._lock:
+            s = self._stats[provider.name]
+            s.calls += 1
+            if error is None:
+                per_word = elapsed / max(1, weight)
+                s.latency = per_word if s.latency is None else 0.7 * s.latency + 0.3 * per_word
+                s.measured_at = time.monotonic()
+                s.error_rate *= 0.7
+                s.consecutive_errors = 0
+            else:
+                s.errors += 1
+                s.error_rate = 0.7 * s.error_rate + 0.3
+                s.consecutive_errors += 1
+                s.last_error = str(error)[:200]
+                if s.consecutive_errors >= self.fail_limit:
+                    s.cooldown_until = time.monotonic() + self.cooldown
+
+    def _attempt(self, provider, prompt, weight):
+        started = time.monotonic()
+        try:
+            words = parse_words(provider.complete(prompt))
+        except Exception as e:
+            self._record(provider, time.monotonic() - started, weight, error=e)
+            raise
+        self._record(provider, time.monotonic() - started, weight)
+        return words
+
+    def generate(self, prompt, weight=1):
+        """가장 좋은 공급자부터 시도해 파싱된 단어 리스트 반환. weight: 요청 단어 수(지연 정규화용).
+
+        모두 실패하면 마지막 예외를 그대로 올린다(json.JSONDecodeError 포함).
+        """
+        candidates = self._ranked()
+        if not candidates:
+            raise NoProviderAvailable('AI 공급자 API 키가 설정되지 않았습니다.')
+
+        pending = {}
+        error = None
+        while candidates or pending:
+            if not pending:
+                p = candidates.pop(0)
+                pending[_pool.submit(self._attempt, p, prompt, weight)] = p
+            hedge = self.hedge_delay if self.hedge_delay > 0 and candidates and len(pending) == 1 else None
+            done, _ = wait(pending, timeout=hedge, return_when=FIRST_COMPLETED)
+            if not done:
+                # 헤지: 응답이 늦으면 다음 공급자에도 동시에 요청
+                p = candidates.pop(0)
+                pending[_pool.submit(self._attempt, p, prompt, weight)] = p
+                continue
+            for fut in done:
+                p = pending.pop(fut)
+                try:
+                    return fut.result()
+                except Exception as e:
+                    print(f'[AI] {p.name} 실패: {e}')
+                    error = e
+        raise error
+
+    def snapshot(self):
+        now = time.monotonic()
+        order = [p.name for p in self._ranked()]
+        with self._lock:
+            providers = {}
+            for p in self._providers:
+                s = self._stats[p.name]
+                providers[p.name] = {
+                    'model': p.model,
+                    'sec_per_word': round(s.latency, 3) if s.latency is not None else None,
+                    'error_rate': round(s.error_rate, 3),
+                    'calls': s.calls,
+                    'errors': s.errors,
+                    'cooling_down': s.cooldown_until > now,
+                    'last_error': s.last_error,
+                }
+            return {'order': order, 'hedge_delay_seconds': self.hedge_delay, 'providers': providers}
@@ -0,0 +1,251 @@
+"""
+사전(Voca + VocaMeaningMap + VocaExampleMap) 바이너리 스냅샷 — 단어 상세 조회용.
+
+단어 상세/사전 패널이 id 하나마다 프록시 → heyvoca_back 을 거치던 것을, 사전 전체를
+파일 하나로 만들어 두고 모든 gunicorn 워커가 읽기 전용 mmap 으로 공유한다
+(페이지 캐시 1벌, 조회는 이진 탐색 + 슬라이스, 네트워크 왕복 없음).
+
+파일 형식 (little-endian):
+    header : magic b'HVDS' | version u32 | count u32 | built_at f64(epoch, 읽기 시작 시각)
+    index  : count × (voca_id u32 | offset u64 | length u32), voca_id 오름차순
+    data   : 레코드별 UTF-8 JSON
+             {id, word, pronunciation, verb_forms, level, is_active,
+              meanings:[{id, meaning}], examples:[{id, exam_en, exam_ko}]}
+
+- 재빌드: 같은 디렉터리 임시 파일에 쓰고 fsync → os.replace (원자적 교체). <path>.lock
+  flock 으로 워커 중 한 곳만 빌드한다. 다른 워커는 inode 변경을 보고 다시 mmap 한다.
+- 사전 변경: 단어/뜻/예문을 바꾸는 프록시 쓰기 요청 성공 시 note_write() 가 <path>.dirty 를
+  갱신하고 재빌드를 건다. dirty 시각이 built_at 보다 늦으면 lookup 은 STALE → 호출측이 백엔드로 폴백.
+- 프록시를 거치지 않은 변경(앱 사용자, 다른 관리 도구)은 알 수 없으므로 built_at 이
+  DICT_SNAPSHOT_MAX_AGE 초보다 오래되면 역시 STALE 로 보고 재빌드한다.
+  읽기 전용 사전 패널용 — 편집 폼은 항상 백엔드(getVoca)에서 읽는다.
+- 빌드 실패 시 DICT_SNAPSHOT_MAX_AGE/10 초 동안 재빌드를 걸지 않는다(조회마다 DB 전체 스캔 방지).
+"""
+import fcntl
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from collections import defaultdict
+
+_MAGIC = b'HVDS'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIId')
+_ENTRY = struct.Struct('<IQI')
+
+# 단어/뜻/예문을 바꾸는 프록시 쓰기 경로 (method, subpath). 단어장 메타, 단어장에서 빼기,
+# 서점, tag_examples(미리보기)는 사전을 바꾸지 않으므로 제외
+_DICT_WRITE_ROUTES = [
+    ('patch', re.compile(r'^voca/\d+(/(hide|show))?$')),                 # T27-T29
+    ('patch', re.compile(r'^voca-books/\d+/words/\d+$')),                # M10 단어 수정
+    ('post', re.compile(r'^voca-books/\d+/words$')),                     # M12 단어 추가(Voca 생성)
+    ('post', re.compile(r'^(admin_)?voca_book(/\d+/word)?$')),           # 엑셀 업로드, 단어 추가
+    ('post', re.compile(r'^admin_voca_book/from_ai$')),                  # T21
+    ('patch', re.compile(r'^admin_voca_book/\d+/save_tagged_examples$')),  # T23
+    ('post', re.compile(r'^dict/apply$')),                               # 사전 버전 적용
+]
+
+MISSING = 'missing'      # 스냅샷 파일 없음(첫 빌드 전)
+STALE = 'stale'          # 빌드 이후 사전 변경 있음 또는 max_age 초과(재빌드 대기)
+NOT_FOUND = 'not_found'  # 스냅샷에 없는 id
+
+
+class DictSnapshot:
+    def __init__(self, path=None):
+        self.path = path
+        self.max_age = 600.0
+        self._app = None
+        self._lock = threading.Lock()
+        self._mm = None
+        self._ident = None       # (st_ino, st_mtime_ns) — 교체 감지
+        self._count = 0
+        self._built_at = 0.0
+        self._rebuild_pending = threading.Event()
+        self._worker = None
+        self._failed_at = None   # 마지막 빌드 실패 시각(monotonic) — 백오프
+
+    def init_app(self, app):
+        self.path = app.config['DICT_SNAPSHOT_PATH']
+        self.max_age = app.config.get('DICT_SNAPSHOT_MAX_AGE', self.max_age)
+        self._app = app
+
+    # ── 읽기 ──
+    def _remap(self):
+        """파일이 교체됐으면 새로 mmap. self._lock 잡은 상태에서 호출."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        ident = (st.st_ino, st.st_mtime_ns)
+        if ident == self._ident:
+            return True
+        with open(self.path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, built_at = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            mm.close()
+            return False
+        if self._mm is not None:
+            self._mm.close()
+        self._mm, self._ident = mm, ident
+        self._count, self._built_at = count, built_at
+        return True
+
+    def _is_stale(self):
+        if time.time() - self._built_at > self.max_age:
+            return True
+        try:
+            return os.stat(self.path + '.dirty').st_mtime > self._built_at
+        except FileNotFoundError:
+            return False
+
+    def lookup(self, voca_id):
+        """(JSON bytes, None) 또는 (None, MISSING|STALE|NOT_FOUND)."""
+        with self._lock:
+            if not self._remap():
+                self.request_rebuild()
+                return None, MISSING
+            if self._is_stale():
+                self.request_rebuild()
+                return None, STALE
+            mm = self._mm
+            lo, hi = 0, self._count - 1
+            base = _HEADER.size
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                vid, offset, length = _ENTRY.unpack_from(mm, base + mid * _ENTRY.size)
+                if vid == voca_id:
+                    return mm[offset:offset + length], None
+                if vid < voca_id:
+                    lo = mid + 1
+                else:
+                    hi = mid - 1
+            return None, NOT_FOUND
+
+    def status(self):
+        with self._lock:
+            ready = self._remap()
+            return {
+                'ready': ready,
+                'stale': ready and self._is_stale(),
+                'count': self._count if ready else 0,
+                'built_at': self._built_at if ready else None,
+                'size_bytes': len(self._mm) if ready else 0,
+                'rebuilding': self._rebuild_pending.is_set(),
+                'backoff': self._backing_off(),
+            }
+
+    # ── 쓰기 ──
+    def note_write(self, method, subpath, status_code):
+        """프록시 쓰기 요청 결과 통보 — 사전 변경 가능성이 있으면 dirty 표시 + 재빌드."""
+        if not (200 <= status_code < 300):
+            return
+        if not any(method == m and pattern.match(subpath) for m, pattern in _DICT_WRITE_ROUTES):
+            return
+        try:
+            with open(self.path + '.dirty', 'a'):
+                os.utime(self.path + '.dirty')
+        except OSError as e:
+            # 백엔드 쓰기는 이미 성공 — 응답을 실패로 바꾸지 않고 max_age 만료에 맡긴다
+            self._app.logger.error(f'[dict_snapshot] dirty 표시 실패: {e}')
+            return
+        self.request_rebuild()
+
+    def _backing_off(self):
+        return self._failed_at is not None and time.monotonic() - self._failed_at < self.max_age / 10
+
+    def request_rebuild(self):
+        """백그라운드 재빌드 예약. 빌드 중 들어온 요청은 한 번 더 빌드로 합쳐진다.
+        최근 빌드가 실패했으면 백오프 동안은 무시."""
+        if self._backing_off():
+            return
+        self._rebuild_pending.set()
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._rebuild_loop, name='dict-snapshot', daemon=True)
+            self._worker.start()
+
+    def _rebuild_loop(self):
+        while self._rebuild_pending.is_set():
+            self._rebuild_pending.clear()
+            try:
+                with self._app.app_context():
+                    self.build()
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                self._rebuild_pending.clear()
+                self._app.logger.error(f'[dict_snapshot] 빌드 실패 ({self.max_age / 10:.0f}초 동안 재빌드 보류): {e}')
+                return
+            self._failed_at = None
+
+    def build(self):
+        """DB 에서 사전 전체를 읽어 스냅샷 파일을 원자적으로 교체. 앱 컨텍스트 필요."""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path + '.lock', 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                # 다른 워커가 방금 최신 스냅샷을 만들었으면 생략
+                with self._lock:
+                    if self._remap() and not self._is_stale():
+                        return
+                built_at = time.time()
+                records = _load_records()
+                tmp = f'{self.path}.{os.getpid()}.tmp'
+                _write_snapshot(tmp, records, built_at)
+                os.replace(tmp, self.path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _load_records():
+    from app.extensions import db
+    from app.models.models import Voca, VocaMeaning, VocaMeaningMap, VocaExample, VocaExampleMap
+
+    meanings = defaultdict(list)
+    rows = (db.session.query(VocaMeaningMap.voca_id, VocaMeaning.id, VocaMeaning.meaning)
+            .join(VocaMeaning, VocaMeaningMap.meaning_id == VocaMeaning.id)
+            .order_by(VocaMeaningMap.voca_id, VocaMeaning.id))
+    for voca_id, mid, meaning in rows.yield_per(5000):
+        meanings[voca_id].append({'id': mid, 'meaning': meaning})
+
+    examples = defaultdict(list)
+    rows = (db.session.query(VocaExampleMap.voca_id, VocaExample.id, VocaExample.exam_en, VocaExample.exam_ko)
+            .join(VocaExample, VocaExampleMap.example_id == VocaExample.id)
+            .order_by(VocaExampleMap.voca_id, VocaExample.id))
+    for voca_id, eid, exam_en, exam_ko in rows.yield_per(5000):
+        examples[voca_id].append({'id': eid, 'exam_en': exam_en, 'exam_ko': exam_ko})
+
+    rows = (db.session.query(Voca.id, Voca.word, Voca.pronunciation, Voca.verb_forms, Voca.level, Voca.is_active)
+            .order_by(Voca.id))
+    for vid, word, pronunciation, verb_forms, level, is_active in rows.yield_per(5000):
+        yield vid, {
+            'id': vid,
+            'word': word,
+            'pronunciation': pronunciation,
+            'verb_forms': verb_forms,
+            'level': level,
+            'is_active': bool(is_active) if is_active is not None else None,
+            'meanings': meanings.pop(vid, []),
+            'examples': examples.pop(vid, []),
+        }
+
+
+def _write_snapshot(path, records, built_at):
+    """records: voca_id 오름차순 (id, dict) 이터러블."""
+    index, blobs = [], []
+    for vid, record in records:
+        blobs.append(json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        index.append(vid)
+
+    offset = _HEADER.size + _ENTRY.size * len(index)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(index), built_at))
+        for vid, blob in zip(index, blobs):
+            f.write(_ENTRY.pack(vid, offset, len(blob)))
+            offset += len(blob)
+        for blob in blobs:
+            f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
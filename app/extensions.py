@@ -4,6 +4,12 @@ from flask_login import LoginManager
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
+from app.admission import AdmissionGovernor
+from app.ai_providers import AiRouter
+from app.dict_snapshot import DictSnapshot
+from app.profiling import RequestProfiler
+from app.upstream import CircuitBreaker
+
 db = SQLAlchemy()
 login_manager = LoginManager()
 
@@ -15,3 +21,18 @@ def _client_ip():
             or get_remote_address())
 
 limiter = Limiter(key_func=_client_ip, default_limits=[])
+
+# heyvoca_back 서킷브레이커 (워커 프로세스 단위). 상태: GET /api/_proxy/health
+breaker = CircuitBreaker()
+
+# 무거운 작업(AI 생성/예문 태깅/엑셀/사전 동기화) 동시 실행 제어 — 초과 시 429 + Retry-After
+governor = AdmissionGovernor()
+
+# 사전 바이너리 스냅샷 (워커 간 mmap 공유) — 단어 상세 조회 /api/dictionary/<id>
+dict_snapshot = DictSnapshot()
+
+# AI 단어 생성 공급자 라우터 (OpenAI/Anthropic/Gemini, 지연·오류율 기반 선택 + 선택적 헤지)
+ai_router = AiRouter()
+
+# 온디맨드 요청 프로파일러 (PROFILE_ENABLED 일 때만 WSGI 미들웨어 설치) — 트레이스 /api/_profile
+profiler = RequestProfiler()
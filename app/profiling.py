@@ -0,0 +1,209 @@
+"""
+요청 단위 온디맨드 프로파일러 — 운영에서 느린 어드민 요청의 시간이 어디에 쓰였는지 확인.
+
+PROFILE_ENABLED=true 일 때만 WSGI 미들웨어를 끼운다(꺼져 있으면 비용 0).
+미들웨어라 세션 로드, load_user(SQLAlchemy), proxy() 직렬화, 백엔드 대기까지 한 번에 잡힌다.
+
+- 트리거: 요청 헤더 X-Profile: cprofile | sample (1 = cprofile) + X-Profile-Token: <PROFILE_TOKEN>,
+  또는 PROFILE_SAMPLE_RATE 확률(오버헤드가 낮은 sample 모드, 세션 쿠키가 있는 요청만).
+  토큰은 프로파일 시작 전에 미들웨어에서 확인 — 미인증 클라이언트가 cProfile 을 켜거나 워커의
+  프로파일 슬롯을 잡지 못하게. PROFILE_TOKEN 이 비어 있으면 헤더 트리거는 꺼진다.
+  · cprofile : cProfile → .pstats (python -m pstats / snakeviz)
+  · sample   : PROFILE_SAMPLE_INTERVAL_MS 간격 스택 샘플링 → .folded (flamegraph.pl / speedscope)
+- 2차 확인: 로그인한 어드민의 요청만 저장(응답 직후 current_user 확인). 워커당 동시에 1건만 프로파일.
+- 저장: PROFILE_DIR 에 <id>.json(메타) + 트레이스 파일, 최근 PROFILE_RING_SIZE 건만 유지.
+  디스크에 두므로 어느 gunicorn 워커에서든 목록/다운로드 가능 (/api/_profile).
+"""
+import cProfile
+import hmac
+import json
+import marshal
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from werkzeug.http import parse_cookie
+
+_ACTIVE_FLAG = 'heyvoca.profiling'
+_AUTH_FLAG = 'heyvoca.profile_authorized'
+
+# 모드 → 트레이스 파일 확장자
+EXTENSIONS = {'cprofile': 'pstats', 'sample': 'folded'}
+
+
+class _StackSampler(threading.Thread):
+    """대상 스레드의 스택을 주기적으로 떠서 collapsed(folded) 형식으로 집계."""
+
+    def __init__(self, target_ident, interval):
+        super().__init__(name='profile-sampler', daemon=True)
+        self.target_ident = target_ident
+        self.interval = interval
+        self.stacks = Counter()
+        self._halt = threading.Event()
+
+    def run(self):
+        while not self._halt.wait(self.interval):
+            frame = sys._current_frames().get(self.target_ident)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def stop(self):
+        self._halt.set()
+        self.join()
+
+    def folded(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+
+class ProfilingMiddleware:
+    def __init__(self, wsgi_app, config):
+        self.wsgi_app = wsgi_app
+        self.sample_rate = config['PROFILE_SAMPLE_RATE']
+        self.interval = config['PROFILE_SAMPLE_INTERVAL_MS'] / 1000
+        self.directory = config['PROFILE_DIR']
+        self.ring_size = config['PROFILE_RING_SIZE']
+        self.token = config.get('PROFILE_TOKEN') or ''
+        self.session_cookie = config.get('SESSION_COOKIE_NAME', 'session')
+        self._busy = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _token_ok(self, environ):
+        supplied = environ.get('HTTP_X_PROFILE_TOKEN', '')
+        return bool(self.token) and hmac.compare_digest(supplied.encode(), self.token.encode())
+
+    def _mode(self, environ):
+        header = environ.get('HTTP_X_PROFILE', '').strip().lower()
+        if header and self._token_ok(environ):
+            if header in ('1', 'true', 'cprofile'):
+                return 'cprofile'
+            if header == 'sample':
+                return 'sample'
+        if (self.sample_rate > 0 and random.random() < self.sample_rate
+                and self.session_cookie in parse_cookie(environ)):
+            return 'sample'
+        return None
+
+    def __call__(self, environ, start_response):
+        mode = self._mode(environ)
+        if mode is None or environ.get('PATH_INFO', '').startswith('/static/'):
+            return self.wsgi_app(environ, start_response)
+        if not self._busy.acquire(blocking=False):
+            return self.wsgi_app(environ, start_response)
+
+        environ[_ACTIVE_FLAG] = mode
+        captured = {}
+
+        def _start_response(status, headers, exc_info=None):
+            captured['status'] = status
+            return start_response(status, headers, exc_info)
+
+        if mode == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = _StackSampler(threading.get_ident(), self.interval)
+            profiler.start()
+        started_at = time.time()
+        started = time.perf_counter()
+        try:
+            # 본문까지 소비해야 직렬화/스트리밍 시간이 포함된다
+            result = self.wsgi_app(environ, _start_response)
+            try:
+                body = list(result)
+            finally:
+                if hasattr(result, 'close'):
+                    result.close()
+        finally:
+            elapsed = time.perf_counter() - started
+            if mode == 'cprofile':
+                profiler.disable()
+            else:
+                profiler.stop()
+            self._busy.release()
+
+        if environ.get(_AUTH_FLAG):
+            try:
+                self._save(mode, profiler, environ, captured.get('status', ''), started_at, elapsed)
+            except OSError as e:
+                print(f'[profile] 저장 실패: {e}')
+        return body
+
+    def _save(self, mode, profiler, environ, status, started_at, elapsed):
+        trace_id = f'{time.time_ns()}-{os.getpid()}'
+        trace_path = os.path.join(self.directory, f'{trace_id}.{EXTENSIONS[mode]}')
+        if mode == 'cprofile':
+            profiler.create_stats()
+            with open(trace_path, 'wb') as f:
+                marshal.dump(profiler.stats, f)   # pstats.Stats(<파일>) 로 바로 로드되는 형식
+        else:
+            with open(trace_path, 'w') as f:
+                f.write(profiler.folded())
+
+        meta = {
+            'id': trace_id,
+            'mode': mode,
+            'method': environ.get('REQUEST_METHOD'),
+            'path': environ.get('PATH_INFO'),
+            'query': environ.get('QUERY_STRING', ''),
+            'status': status.split(' ', 1)[0],
+            'duration_ms': round(elapsed * 1000, 1),
+            'started_at': started_at,
+            'pid': os.getpid(),
+        }
+        # 메타는 트레이스 다음에 원자적으로 — 목록에 보이면 다운로드 가능
+        tmp = os.path.join(self.directory, f'.{trace_id}.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(self.directory, f'{trace_id}.json'))
+        self._trim()
+
+    def _trim(self):
+        metas = sorted(n for n in os.listdir(self.directory) if n.endswith('.json'))
+        for name in metas[:-self.ring_size]:
+            trace_id = name[:-len('.json')]
+            for suffix in ('.json', *(f'.{ext}' for ext in EXTENSIONS.values())):
+                try:
+                    os.remove(os.path.join(self.directory, trace_id + suffix))
+                except FileNotFoundError:
+                    pass
+
+
+def list_traces(directory):
+    """최신순 메타 목록."""
+    if not os.path.isdir(directory):
+        return []
+    traces = []
+    for name in sorted((n for n in os.listdir(directory) if n.endswith('.json')), reverse=True):
+        try:
+            with open(os.path.join(directory, name)) as f:
+                traces.append(json.load(f))
+        except (OSError, ValueError):
+            continue   # 트림과 경합 — 건너뜀
+    return traces
+
+
+class RequestProfiler:
+    def init_app(self, app):
+        """PROFILE_ENABLED 일 때만 미들웨어 + 인증 확인 훅 설치."""
+        if not app.config.get('PROFILE_ENABLED'):
+            return
+
+        from flask import request
+        from flask_login import current_user
+
+        @app.after_request
+        def _mark_profile_authorized(response):
+            # 로그인한 어드민 요청만 트레이스 저장 — current_user 조회는 프로파일 중인 요청에서만
+            if request.environ.get(_ACTIVE_FLAG):
+                request.environ[_AUTH_FLAG] = current_user.is_authenticated
+            return response
+
+        app.wsgi_app = ProfilingMiddleware(app.wsgi_app, app.config)
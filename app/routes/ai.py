@@ -1,18 +1,20 @@
 """
-AI 단어 생성 — OpenAI(gpt-4o-mini) 호출 로직.
+AI 단어 생성 — OpenAI / Anthropic / Gemini 중 가장 빠르고 건강한 공급자로 호출.
 
 기존 bookstore.py 의 _build_condition_text / _call_openai / _deduplicate / ai_generate_words
-를 그대로 이전(보존). 단어 GENERATION 은 heyvoca_admin 내부에서 수행하고,
+를 이전. 단어 GENERATION 은 heyvoca_admin 내부에서 수행하고,
 실제 단어장 저장은 /api/admin_voca_book/from_ai (프록시 → heyvoca_back) 가 담당한다.
+공급자 선택/지연 측정/헤지는 ai_router(app/ai_providers.py) 가 담당한다.
 
 엔드포인트: POST /api/ai/generate_words  (세션 인증 필요)
+           GET  /api/ai/providers        공급자별 지연/오류율/순위
 """
 import json
-import re
 
-from flask import Blueprint, request, jsonify, current_app
-from flask_login import login_required
-from openai import OpenAI
+from flask import Blueprint, request, jsonify
+from flask_login import login_required, current_user
+
+from app.extensions import governor, ai_router
 
 bp = Blueprint('ai', __name__, url_prefix='/api/ai')
 
@@ -28,7 +30,7 @@ def _build_condition_text(book_nm, category, situation):
     return '\n'.join(parts) if parts else '일반 영어 어휘'
 
 
-def _call_openai(client, count, condition_text, exclude_words=None):
+def _call_ai(count, condition_text, exclude_words=None):
     exclude_text = ''
     if exclude_words:
         exclude_text = f'\n다음 단어는 제외하세요: {", ".join(exclude_words)}'
@@ -46,18 +48,7 @@ def _call_openai(client, count, condition_text, exclude_words=None):
   }}
 ]"""
 
-    response = client.chat.completions.create(
-        model='gpt-4o-mini',
-        messages=[{'role': 'user', 'content': prompt}],
-        temperature=0.7,
-        max_tokens=16384,
-    )
-    print(f'[AI] model={response.model}, tokens={response.usage.total_tokens}')
-    text = response.choices[0].message.content.strip()
-    match = re.search(r'\[.*\]', text, re.DOTALL)
-    if match:
-        text = match.group(0)
-    return json.loads(text.strip())
+    return ai_router.generate(prompt, weight=count)
 
 
 def _deduplicate(words):
@@ -80,30 +71,36 @@ def ai_generate_words():
     category = data.get('category', '')
     situation = data.get('situation', '')
 
-    api_key = current_app.config.get('OPENAI_API_KEY', '')
-    if not api_key:
-        return jsonify({'success': False, 'error': 'OpenAI API 키가 설정되지 않았습니다.'}), 500
+    if not ai_router.enabled:
+        return jsonify({'success': False, 'error': 'AI API 키가 설정되지 않았습니다.'}), 500
 
     condition_text = _build_condition_text(book_nm, category, situation)
-    client = OpenAI(api_key=api_key)
 
-    try:
-        # 여유분 20% 더 요청해서 중복 제거 후 부족하면 보완
-        buffer_count = min(int(word_count * 1.2) + 3, 150)
-        words = _deduplicate(_call_openai(client, buffer_count, condition_text))
+    # 동시 생성 제한 — 초과 시 Overloaded → 429 (governor errorhandler)
+    with governor.slot(current_user.get_id()):
+        try:
+            # 여유분 20% 더 요청해서 중복 제거 후 부족하면 보완
+            buffer_count = min(int(word_count * 1.2) + 3, 150)
+            words = _deduplicate(_call_ai(buffer_count, condition_text))
 
-        if len(words) < word_count:
-            existing = [w['word'] for w in words]
-            needed = word_count - len(words)
-            extra = _deduplicate(_call_openai(client, needed + 3, condition_text, exclude_words=existing))
-            existing_lower = {w.lower() for w in existing}
-            words += [w for w in extra if w.get('word', '').lower() not in existing_lower]
+            if len(words) < word_count:
+                existing = [w['word'] for w in words]
+                needed = word_count - len(words)
+                extra = _deduplicate(_call_ai(needed + 3, condition_text, exclude_words=existing))
+                existing_lower = {w.lower() for w in existing}
+                words += [w for w in extra if w.get('word', '').lower() not in existing_lower]
 
-        words = words[:word_count]
+            words = words[:word_count]
 
-    except json.JSONDecodeError:
-        return jsonify({'success': False, 'error': 'AI 응답 형식이 불안정합니다. 다시 시도해주세요.'}), 502
-    except Exception as e:
-        return jsonify({'success': False, 'error': f'AI 생성 중 오류가 발생했습니다: {str(e)}'}), 502
+        except json.JSONDecodeError:
+            return jsonify({'success': False, 'error': 'AI 응답 형식이 불안정합니다. 다시 시도해주세요.'}), 502
+        except Exception as e:
+            return jsonify({'success': False, 'error': f'AI 생성 중 오류가 발생했습니다: {str(e)}'}), 502
 
     return jsonify({'success': True, 'words': words})
+
+
+@bp.route('/providers', methods=['GET'])
+@login_required
+def ai_providers():
+    return jsonify({'code': 200, 'message': 'ok', 'data': ai_router.snapshot()})
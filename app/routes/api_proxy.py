@@ -7,10 +7,24 @@ React SPA(같은 출처)에서 /api/<path> 로 호출하면, 세션 인증(@logi
 
 GET/POST/PATCH/PUT/DELETE + multipart(엑셀 업로드) 지원.
 주의: /api/ai/* 는 ai 블루프린트가 먼저 매칭한다(정적 규칙 우선).
+
+타임아웃/서킷브레이커/GET 헤지는 app/upstream.py 가 담당한다.
+무거운 라우트(is_slow_route)는 governor(app/admission.py) 슬롯을 잡고 호출한다.
+사전을 바꾸는 쓰기 요청이 성공하면 dict_snapshot 재빌드를 건다(app/dict_snapshot.py).
+브레이커 상태: GET /api/_proxy/health (정적 규칙이라 프록시 catch-all 보다 먼저 매칭).
+
+조건부 GET: If-None-Match / If-Modified-Since 를 백엔드로 전달하고(백엔드 304 는 그대로 통과),
+백엔드가 ETag 를 주지 않으면 본문 해시로 강한 ETag 를 만들어 바뀐 게 없으면 304 로 답한다.
+→ 목록 재방문 시 브라우저로는 헤더만 전송 (프론트 api.js 가 검증자 캐시를 유지).
 """
+import hashlib
+
 import requests
 from flask import Blueprint, request, jsonify, current_app, Response
-from flask_login import login_required
+from flask_login import login_required, current_user
+
+from app.extensions import breaker, governor, dict_snapshot
+from app.upstream import backend_request, is_slow_route, UpstreamUnavailable
 
 bp = Blueprint('api_proxy', __name__, url_prefix='/api')
 
@@ -19,16 +33,20 @@ _EXCLUDED_RESP_HEADERS = {
     'content-encoding', 'content-length', 'transfer-encoding', 'connection',
 }
 
+# 백엔드로 전달할 조건부 요청 헤더 (GET 만)
+_CONDITIONAL_REQ_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
 
 @bp.route('/<path:subpath>', methods=['GET', 'POST', 'PATCH', 'PUT', 'DELETE'])
 @login_required
 def proxy(subpath):
-    backend = current_app.config['BACKEND_URL'].rstrip('/')
-    url = f'{backend}/admin/{subpath}'
-    headers = {'X-Admin-API-Key': current_app.config['ADMIN_API_KEY']}
     method = request.method.lower()
 
-    kwargs = {'params': request.args, 'headers': headers, 'timeout': 120}
+    kwargs = {'params': request.args}
+    if method == 'get':
+        kwargs['headers'] = {
+            h: request.headers[h] for h in _CONDITIONAL_REQ_HEADERS if h in request.headers
+        }
 
     if request.files:
         # 엑셀 등 multipart 업로드 — 파일 + 폼 필드 함께 전달
@@ -44,13 +62,47 @@ def proxy(subpath):
         kwargs['data'] = request.form.to_dict()
 
     try:
-        resp = getattr(requests, method)(url, **kwargs)
+        if is_slow_route(subpath):
+            with governor.slot(current_user.get_id()):
+                resp = backend_request(method, subpath, **kwargs)
+        else:
+            resp = backend_request(method, subpath, **kwargs)
+    except UpstreamUnavailable as e:
+        return jsonify({'code': 503, 'message': '백엔드 장애로 잠시 요청을 차단 중입니다. 잠시 후 다시 시도하세요.'}), \
+            503, {'Retry-After': str(e.retry_after)}
     except requests.RequestException as e:
-        current_app.logger.error(f'[proxy] {method.upper()} {url} 실패: {e}')
+        current_app.logger.error(f'[proxy] {method.upper()} /admin/{subpath} 실패: {e}')
         return jsonify({'code': 502, 'message': f'백엔드 연결 실패 ({e})'}), 502
 
+    dict_snapshot.note_write(method, subpath, resp.status_code)
+
     resp_headers = [
         (k, v) for k, v in resp.headers.items()
         if k.lower() not in _EXCLUDED_RESP_HEADERS
     ]
-    return Response(resp.content, status=resp.status_code, headers=resp_headers)
+    response = Response(resp.content, status=resp.status_code, headers=resp_headers)
+
+    if method == 'get' and resp.status_code == 200:
+        if response.get_etag()[0] is None:
+            response.set_etag(hashlib.blake2b(resp.content, digest_size=16).hexdigest())
+        # 세션 인증 데이터 — 공유 캐시(Cloudflare 등) 저장 금지, 매번 재검증
+        response.headers.setdefault('Cache-Control', 'private, no-cache')
+        response.make_conditional(request)
+    return response
+
+
+@bp.route('/_proxy/health', methods=['GET'])
+@login_required
+def proxy_health():
+    """현재 워커의 백엔드 서킷브레이커 상태 + 타임아웃 설정 + 무거운 작업 슬롯 현황."""
+    cfg = current_app.config
+    return jsonify({'code': 200, 'message': 'ok', 'data': {
+        'breaker': breaker.snapshot(),
+        'timeouts': {
+            'connect': cfg['PROXY_CONNECT_TIMEOUT'],
+            'default': cfg['PROXY_TIMEOUT'],
+            'slow': cfg['PROXY_SLOW_TIMEOUT'],
+        },
+        'hedge_delay_ms': cfg['PROXY_HEDGE_DELAY_MS'],
+        'admission': governor.snapshot(),
+    }})
@@ -0,0 +1,38 @@
+"""
+사전 단어 상세 — 워커 공유 mmap 스냅샷(app/dict_snapshot.py)에서 바로 응답.
+
+GET /api/dictionary/<voca_id>  (세션 인증 필요)
+  200 : {code, message, data: {id, word, pronunciation, verb_forms, level, is_active,
+                                meanings:[{id, meaning}], examples:[{id, exam_en, exam_ko}]}}
+  404 : 스냅샷에 없는 id
+  503 : 스냅샷 미생성/재빌드 대기(사전 변경 직후, DICT_SNAPSHOT_MAX_AGE 초과) — 프론트는 기존 프록시 API 로 폴백
+GET /api/dictionary/_status : 스냅샷 상태
+
+/api/dictionary/* 는 정적 규칙이라 api_proxy catch-all 보다 먼저 매칭된다.
+"""
+from flask import Blueprint, jsonify, Response
+from flask_login import login_required
+
+from app.extensions import dict_snapshot
+from app.dict_snapshot import NOT_FOUND
+
+bp = Blueprint('dictionary', __name__, url_prefix='/api/dictionary')
+
+
+@bp.route('/<int:voca_id>', methods=['GET'])
+@login_required
+def dictionary_entry(voca_id):
+    record, reason = dict_snapshot.lookup(voca_id)
+    if reason == NOT_FOUND:
+        return jsonify({'code': 404, 'message': '사전에 없는 단어입니다.'}), 404
+    if reason:
+        return jsonify({'code': 503, 'message': f'사전 스냅샷 준비 중 ({reason})'}), 503
+    # 레코드는 빌드 시 JSON 으로 직렬화돼 있으므로 다시 파싱하지 않고 감싸기만 한다
+    body = b'{"code":200,"message":"ok","data":' + record + b'}'
+    return Response(body, mimetype='application/json')
+
+
+@bp.route('/_status', methods=['GET'])
+@login_required
+def dictionary_status():
+    return jsonify({'code': 200, 'message': 'ok', 'data': dict_snapshot.status()})
@@ -0,0 +1,138 @@
+"""
+Overview 대시보드 스냅샷 — GET /api/overview  (세션 인증 필요)
+
+Overview 화면이 매번 4개 집계 API(progress / study/metrics / fsrs/health /
+study/recent-sessions)를 따로 프록시하던 것을, 워커가 백그라운드에서
+OVERVIEW_REFRESH_SECONDS 마다 4개를 동시에 받아 메모리에 들고 있다가 그대로 내려준다.
+→ 대시보드를 열어도 heyvoca_back 집계는 주기당 1회로 고정.
+
+- 첫 요청 때 동기 갱신 + 갱신 스레드 시작. OVERVIEW_IDLE_SECONDS 동안 아무도 안 보면 멈춘다.
+- ?refresh=1 : 즉시 갱신(새로고침 버튼).
+- 일부 소스 실패 시 직전 값을 유지하고 errors 에 사유를 남긴다.
+- 신선도: sources.<key>.updated_at / age_seconds 는 소스별 마지막 성공 시각.
+  최상위 updated_at / age_seconds 는 하나라도 성공한 마지막 갱신 시각(전부 실패면 그대로,
+  한 번도 성공 못 했으면 null). 상태는 워커 프로세스 단위.
+
+/api/overview 는 정적 규칙이라 api_proxy catch-all 보다 먼저 매칭된다.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from flask import Blueprint, request, jsonify, current_app
+from flask_login import login_required
+
+from app.upstream import backend_request
+
+bp = Blueprint('overview', __name__, url_prefix='/api')
+
+# 스냅샷 키 → (heyvoca_back /admin/<subpath>, params)
+_SOURCES = {
+    'progress': ('progress', {}),
+    'metrics': ('study/metrics', {'days': 7}),
+    'health': ('fsrs/health', {}),
+    'recent_sessions': ('study/recent-sessions', {'limit': 20}),
+}
+
+_pool = ThreadPoolExecutor(max_workers=len(_SOURCES), thread_name_prefix='overview')
+
+
+class _OverviewSnapshot:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._data = {key: None for key in _SOURCES}
+        self._errors = {}
+        self._updated_at = None
+        self._refreshed_mono = 0.0
+        self._source_updated = {}   # key → (datetime, monotonic) 마지막 성공
+        self._last_access = 0.0
+        self._thread = None
+
+    def _fetch(self, app, subpath, params):
+        with app.app_context():
+            resp = backend_request('get', subpath, params=params)
+            resp.raise_for_status()
+            return resp.json().get('data')
+
+    def refresh(self, app):
+        with self._refresh_lock:
+            futures = {
+                key: _pool.submit(self._fetch, app, subpath, params)
+                for key, (subpath, params) in _SOURCES.items()
+            }
+            data, errors = {}, {}
+            for key, fut in futures.items():
+                try:
+                    data[key] = fut.result()
+                except Exception as e:
+                    errors[key] = str(e)[:200]
+            now, mono = datetime.now(), time.monotonic()
+            with self._lock:
+                self._data.update(data)
+                self._errors = errors
+                for key in data:
+                    self._source_updated[key] = (now, mono)
+                # 전부 실패했으면 시각을 올리지 않는다 — 오래된 값을 새것처럼 보이지 않게
+                if data:
+                    self._updated_at = now
+                    self._refreshed_mono = mono
+            if errors:
+                app.logger.warning(f'[overview] 일부 갱신 실패: {errors}')
+
+    def _loop(self, app):
+        interval = app.config['OVERVIEW_REFRESH_SECONDS']
+        idle = app.config['OVERVIEW_IDLE_SECONDS']
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                if time.monotonic() - self._last_access > idle:
+                    self._thread = None
+                    return
+            try:
+                self.refresh(app)
+            except Exception as e:
+                app.logger.error(f'[overview] 갱신 실패: {e}')
+
+    def get(self, app, force=False):
+        with self._lock:
+            self._last_access = time.monotonic()
+            stale = self._updated_at is None
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, args=(app,), name='overview-refresher', daemon=True)
+                self._thread.start()
+                # 멈춰 있던 동안의 값은 오래됐을 수 있음
+                stale = stale or (time.monotonic() - self._refreshed_mono
+                                  > app.config['OVERVIEW_REFRESH_SECONDS'])
+        if stale or force:
+            self.refresh(app)
+        with self._lock:
+            mono = time.monotonic()
+            sources = {
+                key: {
+                    'updated_at': at.isoformat(timespec='seconds'),
+                    'age_seconds': round(mono - at_mono, 1),
+                }
+                for key, (at, at_mono) in self._source_updated.items()
+            }
+            return {
+                **self._data,
+                'errors': dict(self._errors),
+                'sources': sources,
+                'updated_at': self._updated_at.isoformat(timespec='seconds') if self._updated_at else None,
+                'age_seconds': round(mono - self._refreshed_mono, 1) if self._updated_at else None,
+                'refresh_seconds': app.config['OVERVIEW_REFRESH_SECONDS'],
+            }
+
+
+_snapshot = _OverviewSnapshot()
+
+
+@bp.route('/overview', methods=['GET'])
+@login_required
+def overview():
+    force = request.args.get('refresh') in ('1', 'true')
+    app = current_app._get_current_object()
+    return jsonify({'code': 200, 'message': 'ok', 'data': _snapshot.get(app, force=force)})
@@ -0,0 +1,47 @@
+"""
+프로파일 트레이스 조회/다운로드 (app/profiling.py 가 저장한 링 버퍼).
+
+GET /api/_profile                 최신순 목록  (PROFILE_ENABLED 가 꺼져 있으면 404)
+GET /api/_profile/<id>            트레이스 다운로드
+    cprofile → <id>.pstats  (python -m pstats <파일>, snakeviz <파일>)
+    sample   → <id>.folded  (flamegraph.pl <파일> > out.svg, speedscope 에 드래그)
+
+/api/_profile 은 정적 규칙이라 api_proxy catch-all 보다 먼저 매칭된다.
+"""
+import os
+import re
+
+from flask import Blueprint, jsonify, current_app, send_from_directory
+from flask_login import login_required
+
+from app.profiling import EXTENSIONS, list_traces
+
+bp = Blueprint('profiling', __name__, url_prefix='/api/_profile')
+
+_TRACE_ID = re.compile(r'^\d+-\d+$')
+
+
+def _disabled():
+    return jsonify({'code': 404, 'message': '프로파일러가 꺼져 있습니다 (PROFILE_ENABLED).'}), 404
+
+
+@bp.route('', methods=['GET'])
+@login_required
+def profile_list():
+    if not current_app.config['PROFILE_ENABLED']:
+        return _disabled()
+    return jsonify({'code': 200, 'message': 'ok', 'data': list_traces(current_app.config['PROFILE_DIR'])})
+
+
+@bp.route('/<trace_id>', methods=['GET'])
+@login_required
+def profile_download(trace_id):
+    if not current_app.config['PROFILE_ENABLED']:
+        return _disabled()
+    directory = current_app.config['PROFILE_DIR']
+    if _TRACE_ID.match(trace_id):
+        for ext in EXTENSIONS.values():
+            name = f'{trace_id}.{ext}'
+            if os.path.exists(os.path.join(directory, name)):
+                return send_from_directory(directory, name, as_attachment=True)
+    return jsonify({'code': 404, 'message': '트레이스가 없습니다(링 버퍼에서 밀려났을 수 있음).'}), 404
@@ -0,0 +1,205 @@
+"""
+heyvoca_back 호출 공통 계층 — 라우트별 타임아웃 / 서킷브레이커 / GET 헤지.
+
+api_proxy 등 백엔드를 부르는 모든 코드는 backend_request() 를 거친다.
+- 타임아웃: 기본(PROXY_TIMEOUT)은 짧게, 엑셀 업로드·AI 저장·예문 태깅·사전 동기화 같은
+  무거운 라우트만 PROXY_SLOW_TIMEOUT. 백엔드가 느려도 sync 워커가 2분씩 묶이지 않는다.
+- 서킷브레이커: 연결 실패/타임아웃/502·503·504 가 PROXY_BREAKER_THRESHOLD 회 연속이면
+  OPEN → PROXY_BREAKER_COOLDOWN 초 동안 즉시 실패(UpstreamUnavailable). 쿨다운 후
+  HALF_OPEN 에서 프로브 1건만 통과시켜 성공하면 CLOSED, 실패하면 다시 OPEN.
+- 헤지: PROXY_HEDGE_DELAY_MS > 0 이면 멱등 GET 이 그 시간 안에 끝나지 않을 때 같은
+  요청을 한 번 더 보내 먼저 온 응답을 쓴다(꼬리 지연 완화). 진 쪽은 백그라운드에서 끝난다.
+  헤지 풀이 가득 차면(백엔드가 느려 시도들이 쌓인 상황) 헤지 없이 호출 스레드에서 바로 보내고,
+  전체 대기는 라우트 타임아웃(connect + read)을 넘지 않는다.
+
+브레이커 상태는 gunicorn 워커(프로세스)마다 따로 유지된다.
+"""
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+from flask import current_app
+
+# 느린 라우트 (subpath 정규식) — PROXY_SLOW_TIMEOUT 적용
+_SLOW_ROUTES = [
+    re.compile(r'^(admin_)?voca_book$'),                  # 엑셀 업로드 (T10/T15)
+    re.compile(r'^admin_voca_book/from_ai$'),             # AI 단어장 저장 (T21)
+    re.compile(r'(^|/)tag_examples$'),                    # 예문 강조 자동 태깅
+    re.compile(r'^admin_voca_book/\d+/save_tagged_examples$'),
+    re.compile(r'^dict/(publish|apply)$'),                # 사전 동기화
+]
+
+# 브레이커 실패로 보는 백엔드 상태 코드 (게이트웨이/과부하)
+_FAILURE_STATUSES = {502, 503, 504}
+
+_HEDGE_POOL_SIZE = 8
+_hedge_pool = ThreadPoolExecutor(max_workers=_HEDGE_POOL_SIZE, thread_name_prefix='proxy-hedge')
+# 풀에서 실행 중인 시도 수 제한 — 큐에 쌓여 대기하는 일이 없도록 빈 스레드가 있을 때만 제출
+_hedge_slots = threading.BoundedSemaphore(_HEDGE_POOL_SIZE)
+
+
+class UpstreamUnavailable(Exception):
+    """서킷 OPEN — 백엔드를 호출하지 않고 즉시 실패. retry_after: 남은 쿨다운(초)."""
+
+    def __init__(self, retry_after):
+        super().__init__(f'backend circuit open (retry after {retry_after}s)')
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, threshold=5, cooldown=30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._last_error = None
+        self._total_failures = 0
+        self._total_rejected = 0
+
+    def init_app(self, app):
+        self.threshold = app.config.get('PROXY_BREAKER_THRESHOLD', self.threshold)
+        self.cooldown = app.config.get('PROXY_BREAKER_COOLDOWN', self.cooldown)
+
+    def before_call(self):
+        """호출 허용 여부 판단. 막히면 UpstreamUnavailable."""
+        with self._lock:
+            if self._state == self.OPEN:
+                remaining = self._opened_at + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    self._total_rejected += 1
+                    raise UpstreamUnavailable(int(remaining) + 1)
+                self._state = self.HALF_OPEN
+                self._probing = False
+            if self._state == self.HALF_OPEN:
+                # 프로브는 한 건만 — 나머지는 결과가 나올 때까지 즉시 실패
+                if self._probing:
+                    self._total_rejected += 1
+                    raise UpstreamUnavailable(1)
+                self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self, error):
+        with self._lock:
+            self._failures += 1
+            self._total_failures += 1
+            self._last_error = str(error)[:200]
+            if self._state == self.HALF_OPEN or self._failures >= self.threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def snapshot(self):
+        with self._lock:
+            state = self._state
+            retry_after = 0
+            if state == self.OPEN:
+                retry_after = max(0, int(self._opened_at + self.cooldown - time.monotonic()) + 1)
+            return {
+                'state': state,
+                'consecutive_failures': self._failures,
+                'threshold': self.threshold,
+                'cooldown': self.cooldown,
+                'retry_after': retry_after,
+                'last_error': self._last_error,
+                'total_failures': self._total_failures,
+                'total_rejected': self._total_rejected,
+            }
+
+
+def is_slow_route(subpath):
+    return any(p.search(subpath) for p in _SLOW_ROUTES)
+
+
+def route_timeout(subpath):
+    """(connect, read) 타임아웃 튜플."""
+    cfg = current_app.config
+    read = cfg['PROXY_TIMEOUT']
+    if is_slow_route(subpath):
+        read = cfg['PROXY_SLOW_TIMEOUT']
+    return (cfg['PROXY_CONNECT_TIMEOUT'], read)
+
+
+def _submit_get(url, kwargs):
+    """빈 헤지 스레드가 있으면 GET 제출, 없으면 None."""
+    if not _hedge_slots.acquire(blocking=False):
+        return None
+    try:
+        fut = _hedge_pool.submit(requests.get, url, **kwargs)
+    except Exception:
+        _hedge_slots.release()
+        raise
+    fut.add_done_callback(lambda _: _hedge_slots.release())
+    return fut
+
+
+def _hedged_get(url, hedge_delay, kwargs):
+    first = _submit_get(url, kwargs)
+    if first is None:
+        # 풀 포화 — 헤지 생략, 호출 스레드에서 직접 (requests 자체 타임아웃 적용)
+        return requests.get(url, **kwargs)
+
+    connect, read = kwargs['timeout']
+    deadline = time.monotonic() + connect + read
+    done, _ = wait([first], timeout=hedge_delay)
+    if done:
+        return first.result()
+
+    second = _submit_get(url, kwargs)
+    pending = {first} if second is None else {first, second}
+    error = None
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.Timeout(f'hedged GET {url} exceeded {connect + read}s')
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for fut in done:
+            try:
+                return fut.result()
+            except requests.RequestException as e:
+                error = e
+    raise error
+
+
+def backend_request(method, subpath, **kwargs):
+    """heyvoca_back /admin/<subpath> 호출. X-Admin-API-Key 주입 + 타임아웃/브레이커/헤지 적용.
+
+    실패 시 requests.RequestException, 서킷 OPEN 이면 UpstreamUnavailable.
+    """
+    from app.extensions import breaker
+
+    cfg = current_app.config
+    url = f"{cfg['BACKEND_URL'].rstrip('/')}/admin/{subpath}"
+    headers = {**kwargs.pop('headers', {}), 'X-Admin-API-Key': cfg['ADMIN_API_KEY']}
+    kwargs.setdefault('timeout', route_timeout(subpath))
+    kwargs['headers'] = headers
+
+    breaker.before_call()
+    hedge_delay = cfg.get('PROXY_HEDGE_DELAY_MS', 0) / 1000
+    try:
+        if method == 'get' and hedge_delay > 0:
+            resp = _hedged_get(url, hedge_delay, kwargs)
+        else:
+            resp = requests.request(method, url, **kwargs)
+    except Exception as e:
+        breaker.record_failure(e)
+        raise
+
+    if resp.status_code in _FAILURE_STATUSES:
+        breaker.record_failure(f'HTTP {resp.status_code}')
+    else:
+        breaker.record_success()
+    return resp
@@ -1,5 +1,6 @@
 import os
 import secrets
+import tempfile
 import logging
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -44,6 +45,45 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     BACKEND_URL = os.environ.get('BACKEND_URL', 'http://localhost:5100')
 
+    # heyvoca_back 프록시 (app/upstream.py) — 기본 타임아웃은 짧게, 무거운 라우트만 길게.
+    # 브레이커: 연속 실패 THRESHOLD 회 → COOLDOWN 초 동안 즉시 503. HEDGE_DELAY_MS=0 이면 헤지 끔.
+    PROXY_CONNECT_TIMEOUT = float(os.environ.get('PROXY_CONNECT_TIMEOUT', 3))
+    PROXY_TIMEOUT = float(os.environ.get('PROXY_TIMEOUT', 30))
+    PROXY_SLOW_TIMEOUT = float(os.environ.get('PROXY_SLOW_TIMEOUT', 120))
+    PROXY_BREAKER_THRESHOLD = int(os.environ.get('PROXY_BREAKER_THRESHOLD', 5))
+    PROXY_BREAKER_COOLDOWN = float(os.environ.get('PROXY_BREAKER_COOLDOWN', 30))
+    PROXY_HEDGE_DELAY_MS = int(os.environ.get('PROXY_HEDGE_DELAY_MS', 0))
+
+    # 무거운 작업 동시 실행 제어 (app/admission.py). 실행 한도(GLOBAL/PER_ADMIN_LIMIT)는
+    # ADMISSION_LOCK_DIR 슬롯 파일로 같은 호스트의 모든 워커가 공유. 대기열(QUEUE_*)은 워커별.
+    ADMISSION_GLOBAL_LIMIT = int(os.environ.get('ADMISSION_GLOBAL_LIMIT', 2))
+    ADMISSION_PER_ADMIN_LIMIT = int(os.environ.get('ADMISSION_PER_ADMIN_LIMIT', 1))
+    ADMISSION_QUEUE_SIZE = int(os.environ.get('ADMISSION_QUEUE_SIZE', 4))
+    ADMISSION_PER_ADMIN_QUEUE = int(os.environ.get('ADMISSION_PER_ADMIN_QUEUE', 2))
+    ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 30))
+    ADMISSION_POLL_SECONDS = float(os.environ.get('ADMISSION_POLL_SECONDS', 0.2))
+    ADMISSION_LOCK_DIR = os.environ.get(
+        'ADMISSION_LOCK_DIR', os.path.join(tempfile.gettempdir(), 'heyvoca_admission'))
+
+    # Overview 스냅샷 (app/routes/overview.py) — 갱신 주기 / 아무도 안 보면 갱신 중단까지
+    OVERVIEW_REFRESH_SECONDS = float(os.environ.get('OVERVIEW_REFRESH_SECONDS', 30))
+    OVERVIEW_IDLE_SECONDS = float(os.environ.get('OVERVIEW_IDLE_SECONDS', 600))
+
+    # 사전 mmap 스냅샷 파일 (app/dict_snapshot.py) — 같은 호스트의 모든 워커가 공유하는 경로
+    DICT_SNAPSHOT_PATH = os.environ.get(
+        'DICT_SNAPSHOT_PATH', os.path.join(tempfile.gettempdir(), 'heyvoca_dict_snapshot.bin'))
+    # 이보다 오래된 스냅샷은 STALE 로 보고 재빌드 (프록시 밖에서 바뀐 사전 반영)
+    DICT_SNAPSHOT_MAX_AGE = float(os.environ.get('DICT_SNAPSHOT_MAX_AGE', 600))
+
+    # 온디맨드 프로파일러 (app/profiling.py) — 꺼져 있으면 미들웨어 자체를 설치하지 않는다.
+    # 켜면 X-Profile: cprofile|sample 헤더(+ X-Profile-Token) 또는 SAMPLE_RATE 확률로 요청 트레이스 저장.
+    PROFILE_ENABLED = os.environ.get('PROFILE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN', '')   # 비어 있으면 헤더 트리거 꺼짐
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+    PROFILE_SAMPLE_INTERVAL_MS = float(os.environ.get('PROFILE_SAMPLE_INTERVAL_MS', 5))
+    PROFILE_RING_SIZE = int(os.environ.get('PROFILE_RING_SIZE', 50))
+    PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'heyvoca_profiles'))
+
     # 세션 쿠키 보안 — HttpOnly(XSS로 쿠키 탈취 방지), SameSite=Lax(CSRF 완화), 12h 만료.
     # Secure: 서버(HTTPS)는 .env에 SESSION_COOKIE_SECURE=true. 로컬은 HTTP(localhost:5101)라
     # 미설정(기본 false) — 켜면 쿠키가 전송 안 돼 로컬 로그인이 깨진다.
@@ -57,4 +97,19 @@ class Config:
     ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
     OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
 
+    # AI 공급자 라우팅 (app/ai_providers.py) — 키가 있는 공급자만 사용.
+    # *_MODEL 미설정 시 공급자별 기본 모델, *_BASE_URL 은 프록시/로컬 가짜 서버용.
+    OPENAI_MODEL = os.environ.get('OPENAI_MODEL', '')
+    ANTHROPIC_MODEL = os.environ.get('ANTHROPIC_MODEL', '')
+    GEMINI_MODEL = os.environ.get('GEMINI_MODEL', '')
+    OPENAI_BASE_URL = os.environ.get('OPENAI_BASE_URL', '')
+    ANTHROPIC_BASE_URL = os.environ.get('ANTHROPIC_BASE_URL', '')
+    GEMINI_BASE_URL = os.environ.get('GEMINI_BASE_URL', '')
+    AI_TIMEOUT = float(os.environ.get('AI_TIMEOUT', 120))
+    AI_HEDGE_DELAY_SECONDS = float(os.environ.get('AI_HEDGE_DELAY_SECONDS', 0))
+    AI_PROVIDER_FAIL_LIMIT = int(os.environ.get('AI_PROVIDER_FAIL_LIMIT', 3))
+    AI_PROVIDER_COOLDOWN = float(os.environ.get('AI_PROVIDER_COOLDOWN', 60))
+    # 마지막 측정이 이보다 오래된 공급자는 한 번 다시 호출해 지연을 재측정
+    AI_PROVIDER_REPROBE_SECONDS = float(os.environ.get('AI_PROVIDER_REPROBE_SECONDS', 300))
+
 
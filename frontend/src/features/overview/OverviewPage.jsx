@@ -1,14 +1,17 @@
 // Overview 대시보드 (M2~M6) — 요약/지표/FSRS헬스/로드맵 + 자동·수동 새로고침.
+// 데이터는 서버 스냅샷(/api/overview) 한 번으로 받는다. 서버가 백그라운드로 갱신하므로
+// 자동 새로고침은 메모리 조회만, 수동 새로고침은 refresh=1 로 즉시 재집계.
 import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { Button, Spinner, Card } from '@/components/ui/primitives';
 import { ApiError } from '@/lib/api';
-import { getProgress, getMetrics, getHealth } from '@/lib/endpoints';
+import { getOverview } from '@/lib/endpoints';
 import SummaryCards from './SummaryCards';
 import MetricsPanel from './MetricsPanel';
 import HealthPanel from './HealthPanel';
 import PhasesPanel from './PhaseCard';
 
 const REFRESH_MS = 30000;
+const SOURCE_LABELS = { progress: '로드맵', metrics: '학습 지표', health: 'FSRS 헬스', recent_sessions: '최근 세션' };
 
 export default function OverviewPage({ onAuthError }) {
   const [progress, setProgress] = useState(null);
@@ -20,24 +23,26 @@ export default function OverviewPage({ onAuthError }) {
   const [updatedAt, setUpdatedAt] = useState(null);
   const firstLoad = useRef(true);
 
-  const load = useCallback(async () => {
+  const load = useCallback(async ({ refresh = false } = {}) => {
     if (firstLoad.current) setLoading(true); else setRefreshing(true);
-    const results = await Promise.allSettled([getProgress(), getMetrics(7), getHealth()]);
-    const errs = [];
-    let authError = false;
+    let errs = [];
+    try {
+      const snap = (await getOverview({ refresh }))?.data || {};
+      setProgress(snap.progress);
+      setMetrics(snap.metrics);
+      setHealth(snap.health);
+      errs = Object.entries(snap.errors || {}).map(([key, msg]) => {
+        const last = snap.sources?.[key]?.updated_at;
+        const since = last ? ` (${new Date(last).toLocaleTimeString('ko-KR')} 값 표시 중)` : '';
+        return `${SOURCE_LABELS[key] || key}: ${msg || '불러오기 실패'}${since}`;
+      });
+      setUpdatedAt(snap.updated_at ? new Date(snap.updated_at) : null);
+    } catch (e) {
+      if (e instanceof ApiError && e.status === 401) { onAuthError?.(); return; }
+      errs = [`개요: ${e?.message || '불러오기 실패'}`];
+    }
 
-    const [pRes, mRes, hRes] = results;
-    if (pRes.status === 'fulfilled') setProgress(pRes.value?.data); else errs.push(['로드맵', pRes.reason]);
-    if (mRes.status === 'fulfilled') setMetrics(mRes.value?.data); else errs.push(['학습 지표', mRes.reason]);
-    if (hRes.status === 'fulfilled') setHealth(hRes.value?.data); else errs.push(['FSRS 헬스', hRes.reason]);
-
-    errs.forEach(([, reason]) => {
-      if (reason instanceof ApiError && reason.status === 401) authError = true;
-    });
-    if (authError) { onAuthError?.(); return; }
-
-    setErrors(errs.map(([name, reason]) => `${name}: ${reason?.message || '불러오기 실패'}`));
-    setUpdatedAt(new Date());
+    setErrors(errs);
     setLoading(false);
     setRefreshing(false);
     firstLoad.current = false;
@@ -60,7 +65,7 @@ export default function OverviewPage({ onAuthError }) {
             {updatedAt ? `${updatedAt.toLocaleTimeString('ko-KR')} 기준` : ''} · 30초마다 자동 새로고침
           </p>
         </div>
-        <Button variant="secondary" size="sm" onClick={load} loading={refreshing}>새로고침</Button>
+        <Button variant="secondary" size="sm" onClick={() => load({ refresh: true })} loading={refreshing}>새로고침</Button>
       </header>
 
       {errors.length > 0 && (
@@ -4,7 +4,7 @@ import React, { useEffect, useState } from 'react';
 import { Button, Tag } from '@/components/ui/primitives';
 import { ConfirmModal } from '@/components/ui/overlays';
 import { FloppyDisk, Trash, BookOpen } from '@phosphor-icons/react';
-import { patchAdminWord, deleteAdminWord, getVocaDictionary } from '@/lib/endpoints';
+import { patchAdminWord, deleteAdminWord, lookupVocaDictionary } from '@/lib/endpoints';
 import { ApiError } from '@/lib/api';
 import { exOrigin, exMeaning } from './helpers';
 import EmphasisField from './EmphasisField';
@@ -105,7 +105,7 @@ export default function AdminWordRow({ bookId, word, onUpdated, onDeleted, onAut
     if (dict) return;
     setDictLoading(true);
     try {
-      const res = await getVocaDictionary(word.voca_id);
+      const res = await lookupVocaDictionary(word.voca_id);
       setDict(res?.data || null);
     } catch (e) {
       handleErr(e, '사전 조회에 실패했습니다.');
@@ -1,9 +1,10 @@
 // 단어장 관리 공용 헬퍼.
 
 // 예문 항목의 원어/의미를 폴백과 함께 정규화.
-// 백엔드가 {origin,meaning}(신규) 또는 {en,ko}(과거형)를 섞어 내려줄 수 있다.
-export const exOrigin = (ex) => ex?.origin ?? ex?.en ?? '';
-export const exMeaning = (ex) => ex?.meaning ?? ex?.ko ?? '';
+// 백엔드가 {origin,meaning}(신규) 또는 {en,ko}(과거형)를 섞어 내려줄 수 있고,
+// 사전 스냅샷(/api/dictionary)은 VocaExample 컬럼명 {exam_en,exam_ko} 그대로다.
+export const exOrigin = (ex) => ex?.origin ?? ex?.en ?? ex?.exam_en ?? '';
+export const exMeaning = (ex) => ex?.meaning ?? ex?.ko ?? ex?.exam_ko ?? '';
 
 // 편집/저장용으로 항상 {origin,meaning} 형태로 통일.
 export const normalizeExample = (ex) => ({ origin: exOrigin(ex), meaning: exMeaning(ex) });
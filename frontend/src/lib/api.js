@@ -30,8 +30,42 @@ export function buildQuery(params = {}) {
 
 const opts = (extra = {}) => ({ credentials: 'include', ...extra });
 
-export const apiGet = (path) =>
-  fetch(path, opts()).then(parse);
+// 조건부 GET 검증자 캐시 — path → { etag, lastModified, json }. 최근 사용 순(Map 삽입 순서) LRU.
+// 재요청 시 If-None-Match/If-Modified-Since 를 보내고, 304 면 캐시된 JSON 을 그대로 쓴다
+// (프록시가 ETag 를 붙여 주므로 바뀐 게 없으면 헤더만 오간다).
+// fetch 는 cache: 'no-store' — 브라우저 HTTP 캐시가 304 를 가로채지 않도록 직접 관리.
+const VALIDATOR_CACHE_MAX = 200;
+const validatorCache = new Map();
+
+export function clearValidatorCache() {
+  validatorCache.clear();
+}
+
+export async function apiGet(path) {
+  const cached = validatorCache.get(path);
+  const headers = {};
+  if (cached?.etag) headers['If-None-Match'] = cached.etag;
+  if (cached?.lastModified) headers['If-Modified-Since'] = cached.lastModified;
+
+  const res = await fetch(path, opts({ headers, cache: 'no-store' }));
+  if (res.status === 304 && cached) {
+    validatorCache.delete(path);
+    validatorCache.set(path, cached);
+    return cached.json;
+  }
+
+  const json = await parse(res);
+  const etag = res.headers.get('ETag');
+  const lastModified = res.headers.get('Last-Modified');
+  validatorCache.delete(path);
+  if (etag || lastModified) {
+    validatorCache.set(path, { etag, lastModified, json });
+    if (validatorCache.size > VALIDATOR_CACHE_MAX) {
+      validatorCache.delete(validatorCache.keys().next().value);
+    }
+  }
+  return json;
+}
 
 export const apiSend = (path, method, body) =>
   fetch(path, opts({
@@ -51,4 +85,4 @@ export const apiUpload = (path, formData) =>
 // ── 인증 ──
 export const checkSession = () => apiGet('/auth/me');
 export const login = (username, password) => apiPost('/auth/login', { username, password });
-export const logout = () => apiPost('/auth/logout');
+export const logout = () => { clearValidatorCache(); return apiPost('/auth/logout'); };
@@ -69,6 +69,17 @@ export const showVoca = (id) => apiPatch(`/api/voca/${id}/show`, {});  // T29
 export const autocompleteVoca = (q) => apiGet(`/api/voca/autocomplete${buildQuery({ q })}`); // T8(보조)
 export const tagVocaExamples = (id) => apiPost(`/api/voca/${id}/tag_examples`, {}); // 예문 강조 자동 태깅(미리보기)
 
+// 사전 스냅샷 (heyvoca_admin 자체 mmap, 백엔드 왕복 없음)
+// → data: { id, word, pronunciation, verb_forms, level, is_active, meanings:[{id,meaning}], examples:[{id,exam_en,exam_ko}] }
+// 404(스냅샷에 없음)/503(준비·재빌드 중) 이면 기존 프록시 API 로 폴백.
+// 읽기 전용 표시용 — 편집 폼은 최신 값을 덮어쓰지 않도록 getVoca 를 그대로 쓴다.
+const fromDictSnapshot = (vocaId, fallback) =>
+  apiGet(`/api/dictionary/${vocaId}`).catch((e) => {
+    if (e?.status === 404 || e?.status === 503) return fallback(vocaId);
+    throw e;
+  });
+export const lookupVocaDictionary = (id) => fromDictSnapshot(id, getVocaDictionary);    // M11 대체
+
 // ──────────────────────────────────────────────────────────
 // AI 단어 생성 (heyvoca_admin 내부 OpenAI) : T20
 // ──────────────────────────────────────────────────────────
@@ -81,6 +92,9 @@ export const getProgress = () => apiGet('/api/progress');
 export const getMetrics = (days = 7) => apiGet(`/api/study/metrics${buildQuery({ days })}`); // M4
 export const getHealth = () => apiGet('/api/fsrs/health');                      // M5
 export const getRecentSessions = (limit = 20) => apiGet(`/api/study/recent-sessions${buildQuery({ limit })}`);
+// 위 4개를 서버가 백그라운드로 미리 모아 둔 스냅샷 (heyvoca_admin 자체 엔드포인트)
+// → data: { progress, metrics, health, recent_sessions, errors:{key:msg}, updated_at, age_seconds, refresh_seconds }
+export const getOverview = ({ refresh = false } = {}) => apiGet(`/api/overview${buildQuery({ refresh: refresh ? 1 : '' })}`);
 
 // ──────────────────────────────────────────────────────────
 // 사전 동기화 (objectstore 허브: 올리기/내려받기/버전목록)